@@ -5,22 +5,25 @@ from __future__ import annotations
 import asyncio
 from datetime import timedelta
 import logging
+from typing import TYPE_CHECKING
 
-from trixelserviceclient import ClientConfig
 from trixelserviceclient.exception import BaseError
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.storage import Store
 
-from .const import CONF_UPDATE_INTERVAL, STORAGE_KEY_CONFIG, STORAGE_VERSION_CONFIG
+from .const import CONF_UPDATE_INTERVAL, STARTUP_TIMEOUT
 from .integration_polling_client import (
     IntegrationPollingClient,
     NoExistingConfigurationError,
     NoHomeError,
+    remove_client_config,
 )
 
+if TYPE_CHECKING:
+    from trixelserviceclient import ClientConfig
+
 type TrixelContributionConfigEntry = ConfigEntry[ClientConfig]
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,7 +32,7 @@ async def done_callback(
     task: asyncio.Task, hass: HomeAssistant, entry: TrixelContributionConfigEntry
 ) -> None:
     """Reload this integration in hopes of recovering or reporting the error to the user."""
-    if task.exception():
+    if not task.cancelled() and task.exception():
         client: IntegrationPollingClient = entry.runtime_data
         client.kill()
 
@@ -46,10 +49,13 @@ async def async_setup_entry(
     )
     client: IntegrationPollingClient = entry.runtime_data
 
-    task = asyncio.create_task(
+    task = entry.async_create_background_task(
+        hass,
         client.run(
             polling_interval=timedelta(seconds=entry.options[CONF_UPDATE_INTERVAL])
-        )
+        ),
+        name="Trixel contribution client",
+        eager_start=True,
     )
 
     def done(task: asyncio.Task) -> None:
@@ -59,8 +65,12 @@ async def async_setup_entry(
             eager_start=True,
         )
 
-    # Wait and check if the client started successfully
-    await asyncio.sleep(2.5)
+    # Wait until the client is ready or check if it failed while starting
+    ready = asyncio.create_task(client.is_ready.wait())
+    await asyncio.wait(
+        {ready, task}, timeout=STARTUP_TIMEOUT, return_when=asyncio.FIRST_COMPLETED
+    )
+    ready.cancel()
 
     if task.done() and (exception := task.exception()):
         raise ConfigEntryNotReady from exception
@@ -75,6 +85,7 @@ async def async_unload_entry(
     """Unload the config entry and persist the client configuration to storage."""
     client: IntegrationPollingClient = entry.runtime_data
     client.kill()
+    await client.async_save_config()
     return True
 
 
@@ -88,5 +99,4 @@ async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     except (BaseError, NoHomeError, NoExistingConfigurationError):
         _LOGGER.warning("Failed to gracefully remove measurement station from TLS!")
 
-    store = Store[dict](hass, STORAGE_VERSION_CONFIG, STORAGE_KEY_CONFIG)
-    await store.async_remove()
+    await remove_client_config(hass)
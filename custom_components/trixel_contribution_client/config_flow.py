@@ -13,7 +13,6 @@ from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.selector import EntitySelector, EntitySelectorConfig
-from homeassistant.helpers.storage import Store
 
 from .const import (
     CONF_CONF_UPDATED,
@@ -27,13 +26,18 @@ from .const import (
     CONF_UPDATE_INTERVAL,
     CONTRIBUTION_CLIENT,
     DOMAIN,
-    STORAGE_KEY_CONFIG,
-    STORAGE_VERSION_CONFIG,
 )
-from .integration_polling_client import IntegrationPollingClient, NoHomeError
+from .integration_polling_client import (
+    IntegrationPollingClient,
+    NoHomeError,
+    remove_client_config,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# User configuration keys which are stored as config entry data, all other keys are stored as options
+DATA_KEYS = frozenset({CONF_TLS_HOST, CONF_TLS_USE_HTTPS, CONF_TMS_USE_HTTPS})
+
 STEP_GENERAL_CONFIG_FIXED_SCHEMA = {
     vol.Required(CONF_TLS_HOST): str,
     vol.Required(CONF_TLS_USE_HTTPS, default=True): bool,
@@ -59,6 +63,8 @@ STEP_GENERAL_CONFIG_COMBINED_SCHEMA = vol.Schema(
     STEP_GENERAL_CONFIG_FIXED_SCHEMA
 ).extend(STEP_GENERAL_CONFIG_SCHEMA)
 
+STEP_GENERAL_CONFIG_RECONFIGURE_SCHEMA = vol.Schema(STEP_GENERAL_CONFIG_SCHEMA)
+
 STEP_SELECT_SENSOR = vol.Schema(
     {
         vol.Required(CONF_OUTDOOR_TEMPERATURE_SENSORS): EntitySelector(
@@ -100,8 +106,7 @@ def validate_sensor_count(
     """Validate that the user provided sensor collection has at least size 1."""
     errors: dict[str, str] = {}
 
-    sensor_count = sum(len(x) for x in user_input.values())
-    if sensor_count == 0:
+    if not any(user_input.values()):
         errors["base"] = "not_enough_sensors"
         return errors
     return None
@@ -111,10 +116,10 @@ def retrieve_data_and_options(
     user_config: dict[str, Any],
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     """Retrieve the data and option part of the provided user configuration."""
-    data_keys = {CONF_TLS_HOST, CONF_TLS_USE_HTTPS, CONF_TMS_USE_HTTPS}
-
-    data = {key: user_config[key] for key in user_config.keys() & data_keys}
-    options = {key: user_config[key] for key in user_config.keys() ^ data_keys}
+    data: dict[str, Any] = {}
+    options: dict[str, Any] = {}
+    for key, value in user_config.items():
+        (data if key in DATA_KEYS else options)[key] = value
     return data, options
 
 
@@ -162,8 +167,7 @@ class TrixelContributionConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         if user_input is not None:
             # Remove accidentally/old persisted configurations during aborted setup
-            store = Store[dict](self.hass, STORAGE_VERSION_CONFIG, STORAGE_KEY_CONFIG)
-            await store.async_remove()
+            await remove_client_config(self.hass)
 
             self._user_config.update(user_input)
             data, options = retrieve_data_and_options(self._user_config)
@@ -211,7 +215,7 @@ class TrixelContributionConfigFlow(ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="general_settings_reconfigure",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(STEP_GENERAL_CONFIG_SCHEMA), entry.options
+                STEP_GENERAL_CONFIG_RECONFIGURE_SCHEMA, entry.options
             ),
         )
 
@@ -1,5 +1,7 @@
 """Constants for the Trixel contribution client integration."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Final
 
 from trixelserviceclient.schema import MeasurementType
@@ -11,6 +13,19 @@ DOMAIN: Final = "trixel_contribution_client"
 STORAGE_KEY_CONFIG: Final = "trixel_contribution_client_config"
 STORAGE_VERSION_CONFIG: Final = 1
 
+# Delay (seconds) used to batch successive client configuration saves
+CONFIG_SAVE_DELAY: Final = 10
+
+# Maximum time (seconds) to wait for the client to become ready during setup
+STARTUP_TIMEOUT: Final = 30
+
+# Exponential backoff bounds (seconds) used when publishing measurements fails
+RETRY_BASE_INTERVAL: Final = 30
+RETRY_MAX_INTERVAL: Final = 900
+
+# Number of successive polls without updates after which the polling interval is doubled
+MAX_EMPTY_POLLS: Final = 3
+
 CONTRIBUTION_CLIENT: Final = "Trixel contribution client"
 CONF_TLS_HOST: Final = "trixel_lookup_service_host"
 CONF_TLS_USE_HTTPS: Final = "tls_use_https"
@@ -27,12 +42,18 @@ DEFAULT_HOME_LATITUDE = 52.3731339
 DEFAULT_HOME_LONGITUDE = 4.8903147
 
 
-MEASUREMENT_TYPE_MAPPING: Final[dict[MeasurementType, str]] = {
-    MeasurementType.AMBIENT_TEMPERATURE: CONF_OUTDOOR_TEMPERATURE_SENSORS,
-    MeasurementType.RELATIVE_HUMIDITY: CONF_OUTDOOR_RELATIVE_HUMIDITY_SENSORS,
-}
-
-MEASUREMENT_TYPE_DEVICE_CLASS_MAPPING: Final[dict[MeasurementType, str]] = {
-    MeasurementType.AMBIENT_TEMPERATURE: SensorDeviceClass.TEMPERATURE,
-    MeasurementType.RELATIVE_HUMIDITY: SensorDeviceClass.HUMIDITY,
-}
+MEASUREMENT_TYPE_MAPPING: Final[Mapping[MeasurementType, str]] = MappingProxyType(
+    {
+        MeasurementType.AMBIENT_TEMPERATURE: CONF_OUTDOOR_TEMPERATURE_SENSORS,
+        MeasurementType.RELATIVE_HUMIDITY: CONF_OUTDOOR_RELATIVE_HUMIDITY_SENSORS,
+    }
+)
+
+MEASUREMENT_TYPE_DEVICE_CLASS_MAPPING: Final[Mapping[MeasurementType, str]] = (
+    MappingProxyType(
+        {
+            MeasurementType.AMBIENT_TEMPERATURE: SensorDeviceClass.TEMPERATURE,
+            MeasurementType.RELATIVE_HUMIDITY: SensorDeviceClass.HUMIDITY,
+        }
+    )
+)
@@ -1,10 +1,16 @@
 """Client implementations which persist configuration changes with the Home Assistant storage helper."""
 
-from dataclasses import asdict, dataclass
-from datetime import UTC, datetime, timedelta
+import asyncio
+from collections.abc import Callable
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
+import random
 from typing import Any, Self
 
+import httpx
+from trixelserviceclient.exception import BaseError
 from trixelserviceclient.extended_clients.polling_client import PollingClient
 from trixelserviceclient.schema import (
     ClientConfig,
@@ -14,14 +20,27 @@ from trixelserviceclient.schema import (
     Sensor,
 )
 
-from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    EventStateReportedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_state_report_event,
+)
 from homeassistant.helpers.storage import Store
 from homeassistant.util.unit_conversion import TemperatureConverter
 
@@ -29,28 +48,55 @@ from .const import (
     CONF_K_REQUIREMENT,
     CONF_MAX_TRIXEL_DEPTH,
     CONF_TLS_HOST,
+    CONFIG_SAVE_DELAY,
     DEFAULT_HOME_LATITUDE,
     DEFAULT_HOME_LONGITUDE,
+    DOMAIN,
+    MAX_EMPTY_POLLS,
     MEASUREMENT_TYPE_DEVICE_CLASS_MAPPING,
     MEASUREMENT_TYPE_MAPPING,
+    RETRY_BASE_INTERVAL,
+    RETRY_MAX_INTERVAL,
     STORAGE_KEY_CONFIG,
     STORAGE_VERSION_CONFIG,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_NO_VALUE_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+
+_MISSING_STATE_WARNING = (
+    "Entity %s cannot contribute as it's state could not be retrieved!"
+)
+_WRONG_DEVICE_CLASS_WARNING = "Entity %s cannot contribute with wrong device class!"
+_WRONG_UNIT_WARNING = "Entity %s cannot contribute with wrong unit of measurement!"
+
 
-@dataclass
+@dataclass(slots=True)
 class AnnotatedSensor(Sensor):
     """Annotated sensor which can be used to link a sensor to an existing entity id."""
 
     entity_id: str | None = None
 
 
+def get_config_store(hass: HomeAssistant) -> Store[dict]:
+    """Get the helper storage which holds the trixel client config, shared by all users within this integration."""
+    if (store := hass.data.get(DOMAIN)) is None:
+        store = hass.data[DOMAIN] = Store[dict](
+            hass, STORAGE_VERSION_CONFIG, STORAGE_KEY_CONFIG
+        )
+    return store
+
+
+async def remove_client_config(hass: HomeAssistant) -> None:
+    """Remove the trixel client config (including pending delayed saves) from persistent storage."""
+    await get_config_store(hass).async_remove()
+    hass.data.pop(DOMAIN)
+
+
 async def load_client_config(hass: HomeAssistant) -> ClientConfig:
     """Load the trixel client config form persistent storage."""
-    store = Store[dict](hass, STORAGE_VERSION_CONFIG, STORAGE_KEY_CONFIG)
-    config_dict = await store.async_load()
+    config_dict = await get_config_store(hass).async_load()
     if config_dict is None:
         raise FileNotFoundError(
             "Helper storage does not contain a client configuration!"
@@ -69,11 +115,57 @@ async def load_client_config(hass: HomeAssistant) -> ClientConfig:
     return client_config
 
 
+def serialize_client_config(client_config: ClientConfig) -> dict[str, Any]:
+    """Convert the trixel client config into a dictionary which can be persisted in the storage helper."""
+    ms_config: MeasurementStationConfig | None = client_config.ms_config
+    return {
+        "location": {
+            "latitude": client_config.location.latitude,
+            "longitude": client_config.location.longitude,
+        },
+        "k": client_config.k,
+        "tls_host": client_config.tls_host,
+        "sensors": [
+            {
+                "measurement_type": sensor.measurement_type,
+                "accuracy": sensor.accuracy,
+                "sensor_name": sensor.sensor_name,
+                "sensor_id": sensor.sensor_id,
+                "entity_id": sensor.entity_id,
+            }
+            for sensor in client_config.sensors
+        ],
+        "max_depth": client_config.max_depth,
+        "client_timeout": client_config.client_timeout,
+        "tls_use_ssl": client_config.tls_use_ssl,
+        "tms_use_ssl": client_config.tms_use_ssl,
+        "tms_address_override": client_config.tms_address_override,
+        "ms_config": None
+        if ms_config is None
+        else {"uuid": ms_config.uuid, "token": ms_config.token},
+    }
+
+
 class IntegrationPollingClient(PollingClient):
     """A client implementation which persists the configuration with Home Assistants helper Storage."""
 
     hass: HomeAssistant
-    _last_timestamps: dict[int, int]
+    _store: Store[dict]
+    _pending_updates: dict[int, tuple[datetime, float]]
+
+    # Per-sensor lookup tables (indexed by position in the sensor list) used while processing entity states
+    _entity_ids: tuple[str, ...]
+    _entity_indices: dict[str, int]
+    _sensor_ids: tuple[int | None, ...]
+    _device_classes: tuple[str, ...]
+    _is_temperature: tuple[bool, ...]
+    _last_timestamps: list[int]
+    # Set once a sensor's invalid state was reported to avoid repeating the warning on every state update
+    _warned: list[bool]
+
+    # Temperature converters (and the unit for which they were created) resolved on first use
+    _units: list[str | None]
+    _converters: list[Callable[[float], float] | None]
 
     def __init__(self, hass: HomeAssistant, config: ClientConfig | None = None) -> None:
         """Instantiate a IntegrationPollingClient based on the provided configuration.
@@ -82,8 +174,12 @@ class IntegrationPollingClient(PollingClient):
         :param config: client configuration which is used in case no pickle file is found or when override is enabled
         """
         self.hass = hass
-        self._last_timestamps: dict[int, int] = {}
+        self._store = get_config_store(hass)
+        self._sensor_ids = ()
+        self._last_timestamps = []
+        self._pending_updates: dict[int, tuple[datetime, float]] = {}
         super().__init__(config, None)
+        self._rebuild_sensor_cache()
 
     @classmethod
     async def create(
@@ -116,46 +212,31 @@ class IntegrationPollingClient(PollingClient):
                 client_config.k = options[CONF_K_REQUIREMENT]
                 client_config.max_depth = options[CONF_MAX_TRIXEL_DEPTH]
 
-                # Find differences between the new and an existing user configuration
-                orphaned_sensors: list[AnnotatedSensor] = []
-                new_sensors: list[tuple[MeasurementType, str]] = []
-                for measurement_type in MeasurementType:
-                    sensor: AnnotatedSensor
-                    entity_ids = options[MEASUREMENT_TYPE_MAPPING.get(measurement_type)]
-                    for entity_id in entity_ids:
-                        entity_used: bool = False
-                        for sensor in client_config.sensors:
-                            if (
-                                sensor.measurement_type == measurement_type
-                                and sensor.entity_id == entity_id
-                            ):
-                                entity_used = True
-                        if not entity_used:
-                            new_sensors.append((measurement_type, entity_id))
-
-                    orphaned_sensors.extend(
-                        [
-                            sensor
-                            if sensor.measurement_type == measurement_type
-                            and sensor.entity_id not in entity_ids
-                            else None
-                            for sensor in client_config.sensors
-                        ]
-                    )
+                # Find differences between the new and an existing user configuration in a single pass, entities which
+                # are not claimed by an existing sensor remain as new sensors (ordered dicts keep the user's order)
+                new_entity_ids: dict[MeasurementType, dict[str, None]] = {
+                    measurement_type: dict.fromkeys(options[conf_value])
+                    for measurement_type, conf_value in MEASUREMENT_TYPE_MAPPING.items()
+                }
+                sensors: list[AnnotatedSensor] = []
+                for sensor in client_config.sensors:
+                    entity_ids = new_entity_ids[sensor.measurement_type]
+                    if sensor.entity_id in entity_ids:
+                        del entity_ids[sensor.entity_id]
+                        sensors.append(sensor)
 
                 # Remove orphaned user configuration sensors from the client config such that they are later removed
                 # from the TMS
-                for sensor in orphaned_sensors:
-                    if sensor is not None:
-                        client_config.sensors.remove(sensor)
+                client_config.sensors = sensors
 
                 # Add new sensors using a basic configuration
-                for measurement_type, entity_id in new_sensors:
+                for measurement_type, entity_ids in new_entity_ids.items():
                     # TODO: add detail (sensor name and accuracy) to sensor object
-                    client_config.sensors.append(
+                    client_config.sensors.extend(
                         AnnotatedSensor(
                             measurement_type=measurement_type, entity_id=entity_id
                         )
+                        for entity_id in entity_ids
                     )
 
         except FileNotFoundError as e:
@@ -187,74 +268,140 @@ class IntegrationPollingClient(PollingClient):
 
         return cls(hass=hass, config=client_config)
 
+    def _rebuild_sensor_cache(self) -> None:
+        """Rebuild the per-sensor lookup tables from the current sensor configuration."""
+        sensors: list[AnnotatedSensor] = self._config.sensors
+        self._entity_ids = tuple(sensor.entity_id for sensor in sensors)
+        self._entity_indices = {
+            entity_id: index for index, entity_id in enumerate(self._entity_ids)
+        }
+        # Keep the timestamps of already transmitted measurements for sensors which remain configured
+        last_timestamps = dict(zip(self._sensor_ids, self._last_timestamps))
+        self._sensor_ids = tuple(sensor.sensor_id for sensor in sensors)
+        self._last_timestamps = [
+            last_timestamps.get(sensor_id, 0) for sensor_id in self._sensor_ids
+        ]
+        self._device_classes = tuple(
+            MEASUREMENT_TYPE_DEVICE_CLASS_MAPPING[sensor.measurement_type]
+            for sensor in sensors
+        )
+        self._is_temperature = tuple(
+            sensor.measurement_type == MeasurementType.AMBIENT_TEMPERATURE
+            for sensor in sensors
+        )
+        self._warned = [False] * len(sensors)
+        self._units = [None] * len(sensors)
+        self._converters = [None] * len(sensors)
+
     async def _persist_config(self):
         """Persist the clients configuration in the helper storage."""
-        store = Store[dict](self.hass, STORAGE_VERSION_CONFIG, STORAGE_KEY_CONFIG)
-        await store.async_save(asdict(self._config))
+        # The base client calls this method after every change to the sensor list (e.g. assigned sensor ids)
+        self._rebuild_sensor_cache()
+        # The storage helper calls data_func within the executor, hence a snapshot is taken on the event loop since
+        # the configuration may still be modified by the client (e.g. during sensor synchronization)
+        data = self._serialize_config()
+        self._store.async_delay_save(lambda: data, CONFIG_SAVE_DELAY)
+
+    async def start(self):
+        """Start the client and immediately persist the configuration, which may contain fresh TMS credentials."""
+        await super().start()
+        await self.async_save_config()
+
+    async def async_save_config(self) -> None:
+        """Immediately write the clients configuration (and pending delayed saves) to the helper storage."""
+        await self._store.async_save(self._serialize_config())
+
+    def _serialize_config(self) -> dict[str, Any]:
+        """Serialize the current client configuration for the helper storage."""
+        return serialize_client_config(self._config)
+
+    def _process_state(self, index: int, state: State | None) -> None:
+        """Validate and convert an entity state and queue it for publishing to the TMS."""
+        if state is None:
+            self._warn_once(index, _MISSING_STATE_WARNING)
+            return
+
+        # Ignore already transmitted measurements
+        measurement_timestamp = round(state.last_reported.timestamp())
+        if measurement_timestamp == self._last_timestamps[index]:
+            return
+
+        value = None if state.state in _NO_VALUE_STATES else state.state
+
+        if state.attributes[ATTR_DEVICE_CLASS] != self._device_classes[index]:
+            # TODO: raise user - visible warning
+            self._warn_once(index, _WRONG_DEVICE_CLASS_WARNING)
+            return
+        if (
+            self._is_temperature[index]
+            and state.attributes[ATTR_UNIT_OF_MEASUREMENT] not in UnitOfTemperature
+        ):
+            # TODO: raise user - visible warning
+            self._warn_once(index, _WRONG_UNIT_WARNING)
+            return
+
+        # Convert units to standard used in the network
+        if self._is_temperature[index] and value is not None:
+            value = float(value)
+            unit = state.attributes[ATTR_UNIT_OF_MEASUREMENT]
+            if unit != UnitOfTemperature.CELSIUS:
+                converter = self._converters[index]
+                if converter is None or unit != self._units[index]:
+                    converter = TemperatureConverter.converter_factory(
+                        unit, UnitOfTemperature.CELSIUS
+                    )
+                    self._units[index] = unit
+                    self._converters[index] = converter
+                value = converter(value)
+
+        self._warned[index] = False
+        self._last_timestamps[index] = measurement_timestamp
+        self._pending_updates[self._sensor_ids[index]] = (
+            measurement_timestamp,
+            value,
+        )
 
-    def _get_updates(
-        self,
-    ) -> dict[int, tuple[datetime, float]]:
-        """Get the related entity states and returns them for publishing to the TMS."""
+    def _warn_once(self, index: int, message: str) -> None:
+        """Log a warning for a sensor unless it was already issued since the sensor's last valid state."""
+        if not self._warned[index]:
+            self._warned[index] = True
+            _LOGGER.warning(message, self._entity_ids[index])
 
-        updates: dict[int, tuple[datetime, float]] = {}
+    @callback
+    def _handle_state_event(
+        self, event: Event[EventStateChangedData] | Event[EventStateReportedData]
+    ) -> None:
+        """Queue the new state of a changed or re-reported entity."""
+        if (index := self._entity_indices.get(event.data["entity_id"])) is not None:
+            self._process_state(index, event.data["new_state"])
 
-        sensor: AnnotatedSensor
-        for sensor in self.sensors:
-            state: State | None = self.hass.states.get(sensor.entity_id)
+    def _track_states(self) -> CALLBACK_TYPE:
+        """Queue the current entity states and track subsequent state updates.
 
-            if state is None:
-                _LOGGER.warning(
-                    "Entity %s cannot contribute as it's state could not be retrieved!",
-                    sensor.entity_id,
-                )
-                continue
-
-            value = None if state.state in ("unavailable", "unknown") else state.state
-
-            if (
-                state.attributes[ATTR_DEVICE_CLASS]
-                != MEASUREMENT_TYPE_DEVICE_CLASS_MAPPING[sensor.measurement_type]
-            ):
-                # TODO: raise user - visible warning
-                _LOGGER.warning(
-                    "Entity %s cannot contribute with wrong device class!",
-                    sensor.entity_id,
-                )
-                continue
-            if (
-                sensor.measurement_type == MeasurementType.AMBIENT_TEMPERATURE
-                and state.attributes[ATTR_UNIT_OF_MEASUREMENT] not in UnitOfTemperature
-            ):
-                # TODO: raise user - visible warning
-                _LOGGER.warning(
-                    "Entity %s cannot contribute with wrong unit of measurement!",
-                    sensor.entity_id,
-                )
-                continue
-
-            # Convert units to standard used in the network
-            if (
-                state.attributes[ATTR_DEVICE_CLASS] == SensorDeviceClass.TEMPERATURE
-                and value is not None
-            ):
-                value = TemperatureConverter.convert(
-                    value,
-                    state.attributes[ATTR_UNIT_OF_MEASUREMENT],
-                    UnitOfTemperature.CELSIUS,
-                )
+        :returns: callback which stops tracking state updates
+        """
+        for index, entity_id in enumerate(self._entity_ids):
+            self._process_state(index, self.hass.states.get(entity_id))
 
-            measurement_timestamp = int(
-                round(state.last_reported.astimezone(UTC).timestamp())
-            )
-            # Ignore already transmitted measurements
-            if measurement_timestamp != self._last_timestamps.get(sensor.sensor_id, 0):
-                self._last_timestamps[sensor.sensor_id] = measurement_timestamp
-                updates[sensor.sensor_id] = (
-                    measurement_timestamp,
-                    value,
-                )
+        unsub_changed = async_track_state_change_event(
+            self.hass, self._entity_ids, self._handle_state_event
+        )
+        unsub_reported = async_track_state_report_event(
+            self.hass, self._entity_ids, self._handle_state_event
+        )
+
+        def unsub() -> None:
+            unsub_changed()
+            unsub_reported()
+
+        return unsub
 
+    def _get_updates(
+        self,
+    ) -> dict[int, tuple[datetime, float]]:
+        """Get the entity states which were updated since the last call for publishing to the TMS."""
+        updates = self._pending_updates
+        self._pending_updates = {}
         return updates
 
     async def run(
@@ -262,14 +409,54 @@ class IntegrationPollingClient(PollingClient):
         polling_interval: timedelta = timedelta(seconds=60),
         delete: bool = False,
     ):
-        """Run this polling trixel service client."""
-        return await super().run(
-            get_updates=self._get_updates if delete is False else None,
-            retry_interval=timedelta(seconds=30),
-            max_retries=0,
-            polling_interval=polling_interval,
-            delete=delete,
-        )
+        """Run this polling trixel service client.
+
+        Failed publishes are retried with a jittered exponential backoff, and the polling interval is stretched up to
+        twice the configured value while no sensor updates are available.
+        """
+        await self.start()
+        if delete:
+            await self.delete()
+            return
+
+        unsub = self._track_states()
+        try:
+            await self._publish_updates(polling_interval)
+        finally:
+            unsub()
+
+    async def _publish_updates(self, polling_interval: timedelta):
+        """Periodically publish queued sensor updates until the client is killed."""
+        updates: dict[int, tuple[datetime, float]] = {}
+        failures: int = 0
+        empty_polls: int = 0
+        while not self.is_dead.is_set():
+            delay = polling_interval.total_seconds()
+
+            # Keep values of failed publishes such that they are sent with the next attempt
+            updates.update(self._get_updates())
+            if updates:
+                empty_polls = 0
+                try:
+                    await self.publish_values(updates=updates)
+                    updates.clear()
+                    failures = 0
+                except (BaseError, httpx.HTTPError) as e:
+                    _LOGGER.warning("Failed to publish values: %s", e)
+                    # Never retry more often than the configured polling interval
+                    delay = max(
+                        delay,
+                        min(RETRY_MAX_INTERVAL, RETRY_BASE_INTERVAL * 2**failures)
+                        * random.uniform(0.5, 1.5),
+                    )
+                    failures += 1
+            else:
+                empty_polls += 1
+                if empty_polls >= MAX_EMPTY_POLLS:
+                    delay *= 2
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self.is_dead.wait(), timeout=delay)
 
 
 class NoHomeError(HomeAssistantError):